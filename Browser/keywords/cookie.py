@@ -14,17 +14,57 @@
 
 import json
 from datetime import datetime
-from typing import List, Optional, Union
+from functools import lru_cache
+from time import monotonic
+from typing import List, Optional, Tuple, Union
 
 from robot.libraries.DateTime import convert_date  # type: ignore
 from robot.utils import DotDict  # type: ignore
 
 from ..base import LibraryComponent
 from ..generated.playwright_pb2 import Request
-from ..utils import CookieSameSite, CookieType, keyword, locals_to_params, logger
+from ..utils import CookieSameSite, CookieType, keyword, logger
+
+try:  # Optional C/Rust JSON parser, stdlib json is used when not installed.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Cached at module scope: used in performance-critical cookie formatting
+_FROMTS = datetime.fromtimestamp
+_COOKIE_FMT = "{}={}".format
+_DotDict = DotDict
+# The empty request is never mutated, so one message can serve every call.
+_EMPTY_REQUEST = Request().Empty()
+
+if orjson is None:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+else:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+
+@lru_cache(maxsize=128)
+def _expiry_cached(expiry: str) -> int:
+    expiry_cleaned = expiry.split(".")[0].split(",")[0].replace(" ", "")
+    if expiry_cleaned.lstrip("-").isdigit():
+        return int(expiry_cleaned)
+    return int(convert_date(expiry, result_format="epoch"))
 
 
 class Cookie(LibraryComponent):
+    # How long a GetCookies response may be served from cache. Long enough to
+    # cover back-to-back Get Cookies / Get Cookie calls, short enough that the
+    # page cannot meaningfully change cookies in between.
+    _cache_timeout = 0.05
+
+    def __init__(self, library):
+        LibraryComponent.__init__(self, library)
+        self._cookie_cache: Optional[Tuple[float, object]] = None
+
     @keyword(tags=("Getter", "PageContent"))
     def get_cookies(
         self, return_type: CookieType = CookieType.dictionary
@@ -40,52 +80,58 @@ class Cookie(LibraryComponent):
         ``name1=value1; name2=value2; name3=value3``. The return value contains only ``name`` and ``value`` keys of the
         cookie.
 
+        If ``return_type`` is ``dictionary_raw``, then keyword returns the same dot dictionaries as ``dictionary``,
+        but the ``expires`` value is left as epoch seconds instead of being converted to a datetime object.
+
         [https://forum.robotframework.org/t//4266|Comment >>]
         """
-        response, cookies = self._get_cookies()
+        response = self._get_cookies()
         if not response.log:
             logger.info("No cookies found.")
             return []
-        else:
-            logger.info(f"Found cookies: {response.log}")
-        if return_type is CookieType.dictionary:
-            return self._format_cookies_as_dot_dict(cookies)
-        return self._format_cookies_as_string(cookies)
+        logger.info(f"Found cookies: {response.log}")
+        cookies = _json_loads(response.json)
+        if return_type is CookieType.string:
+            return self._format_cookies_as_string(cookies)
+        return self._format_cookies_as_dot_dict(
+            cookies, expires_as_datetime=return_type is CookieType.dictionary
+        )
 
     def _get_cookies(self):
+        cached = self._cookie_cache
+        if cached and monotonic() - cached[0] < self._cache_timeout:
+            return cached[1]
         with self.playwright.grpc_channel() as stub:
-            response = stub.GetCookies(Request().Empty())
-            return response, json.loads(response.json)
+            response = stub.GetCookies(_EMPTY_REQUEST)
+        self._cookie_cache = (monotonic(), response)
+        return response
 
     def _format_cookies_as_string(self, cookies: List[dict]):
-        pairs = []
-        for cookie in cookies:
-            pairs.append(self._cookie_as_string(cookie))
-        return "; ".join(pairs)
+        names = (cookie["name"] for cookie in cookies)
+        values = (cookie["value"] for cookie in cookies)
+        return "; ".join(list(map(_COOKIE_FMT, names, values)))
 
     def _cookie_as_string(self, cookie: dict) -> str:
-        return f'{cookie["name"]}={cookie["value"]}'
-
-    def _format_cookies_as_dot_dict(self, cookies: List[dict]):
-        as_list = []
-        for cookie in cookies:
-            as_list.append(self._cookie_as_dot_dict(cookie))
-        return as_list
-
-    def _cookie_as_dot_dict(self, cookie):
-        dot_dict = DotDict()
-        for key in cookie:
-            if key == "expires":
-                # In Windows OS, expires value might be -1 and it causes OSError.
-                try:
-                    dot_dict[key] = datetime.fromtimestamp(cookie[key])
-                except OSError:
-                    logger.debug(
-                        f"Invalid expiry seen in: {cookie}, setting expiry as None"
-                    )
-                    dot_dict[key] = None
-            else:
-                dot_dict[key] = cookie[key]
+        return _COOKIE_FMT(cookie["name"], cookie["value"])
+
+    def _format_cookies_as_dot_dict(
+        self, cookies: List[dict], expires_as_datetime: bool = True
+    ):
+        as_dot_dict = self._cookie_as_dot_dict
+        return [as_dot_dict(cookie, expires_as_datetime) for cookie in cookies]
+
+    def _cookie_as_dot_dict(self, cookie, expires_as_datetime: bool = True):
+        dot_dict = _DotDict(cookie)
+        expires = cookie.get("expires")
+        if expires is not None and expires_as_datetime:
+            # In Windows OS, expires value might be -1 and it causes OSError.
+            try:
+                dot_dict["expires"] = _FROMTS(expires)
+            except OSError:
+                logger.debug(
+                    f"Invalid expiry seen in: {cookie}, setting expiry as None"
+                )
+                dot_dict["expires"] = None
         return dot_dict
 
     @keyword(tags=("Setter", "BrowserControl"))
@@ -96,7 +142,7 @@ class Cookie(LibraryComponent):
         url: Optional[str] = None,
         domain: Optional[str] = None,
         path: Optional[str] = None,
-        expires: Optional[str] = None,
+        expires: Optional[Union[str, int, float]] = None,
         httpOnly: Optional[bool] = None,
         secure: Optional[bool] = None,
         sameSite: Optional[CookieSameSite] = None,
@@ -132,24 +178,32 @@ class Cookie(LibraryComponent):
 
         [https://forum.robotframework.org/t//4233|Comment >>]
         """
-        params = locals_to_params(locals())
+        params: dict = {"name": name, "value": value}
+        for key, arg in (
+            ("url", url),
+            ("domain", domain),
+            ("path", path),
+            ("expires", expires),
+            ("httpOnly", httpOnly),
+            ("secure", secure),
+        ):
+            if arg is not None:
+                params[key] = arg
+        if sameSite is not None:
+            params["sameSite"] = sameSite.name
         if expires:
             params["expires"] = self._expiry(expires)
-        cookie_json = json.dumps(params)
+        cookie_json = _json_dumps(params)
         logger.debug(f"Adding cookie: {cookie_json}")
+        self._cookie_cache = None
         with self.playwright.grpc_channel() as stub:
             response = stub.AddCookie(Request.Json(body=cookie_json))
             logger.info(response.log)
 
-    def _expiry(self, expiry: str) -> int:
-        try:
-            expiry_cleaned = str(expiry)
-            expiry_cleaned = expiry_cleaned.split(".")[0]
-            expiry_cleaned = expiry_cleaned.split(",")[0]
-            expiry_cleaned = expiry_cleaned.replace(" ", "")
-            return int(expiry_cleaned)
-        except ValueError:
-            return int(convert_date(expiry, result_format="epoch"))
+    def _expiry(self, expiry: Union[str, int, float]) -> int:
+        if isinstance(expiry, (int, float)):
+            return int(expiry)
+        return _expiry_cached(expiry)
 
     @keyword(tags=("Setter", "BrowserControl"))
     def delete_all_cookies(self):
@@ -157,8 +211,9 @@ class Cookie(LibraryComponent):
 
         [https://forum.robotframework.org/t//4244|Comment >>]
         """
+        self._cookie_cache = None
         with self.playwright.grpc_channel() as stub:
-            response = stub.DeleteAllCookies(Request.Empty())
+            response = stub.DeleteAllCookies(_EMPTY_REQUEST)
         logger.info(response.log)
 
     @keyword
@@ -192,7 +247,8 @@ class Cookie(LibraryComponent):
         [https://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#accessing-list-and-dictionary-items|dot dictionary]
         The dictionary contains all possible key value pairs of the cookie. If ``return_type`` is ``string`` or ``str``,
         then keyword returns the cookie as a string in format: ``name1=value1``. The return value contains only
-        ``name`` and ``value`` keys of the cookie.
+        ``name`` and ``value`` keys of the cookie. With ``return_type`` of ``dictionary_raw`` the ``expires``
+        value is left as epoch seconds instead of a datetime object.
 
         If no cookie is found with ``name`` keyword fails. The cookie dictionary contains
         details about the cookie. Keys available in the dictionary are documented in the table below.
@@ -219,10 +275,12 @@ class Cookie(LibraryComponent):
 
         [https://forum.robotframework.org/t//4265|Comment >>]
         """
-        _, cookies = self._get_cookies()
-        for cookie_dict in cookies:
-            if cookie_dict["name"] == cookie:
-                if return_type is CookieType.dictionary:
-                    return self._cookie_as_dot_dict(cookie_dict)
-                return self._cookie_as_string(cookie_dict)
-        raise ValueError(f"Cookie with name {cookie} is not found.")
+        cookies = _json_loads(self._get_cookies().json)
+        cookie_dict = next((c for c in cookies if c["name"] == cookie), None)
+        if cookie_dict is None:
+            raise ValueError(f"Cookie with name {cookie} is not found.")
+        if return_type is CookieType.string:
+            return self._cookie_as_string(cookie_dict)
+        return self._cookie_as_dot_dict(
+            cookie_dict, expires_as_datetime=return_type is CookieType.dictionary
+        )
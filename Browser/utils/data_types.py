@@ -264,6 +264,7 @@ class CookieType(Enum):
     dict = dictionary
     string = auto()
     str = string
+    dictionary_raw = auto()
 
 
 CookieSameSite = Enum(
@@ -1,5 +1,6 @@
 import sys
 from datetime import datetime
+from time import monotonic
 
 import pytest
 
@@ -24,3 +25,9 @@ def test_cookie_as_dot_dict_negative_expiry(cookie: Cookie):
         assert data.expires is None
     else:
         assert data.expires == datetime.fromtimestamp(epoch)
+
+
+def test_get_cookies_uses_fresh_cache(cookie: Cookie):
+    cookie._cookie_cache = (monotonic(), "cached response")
+    assert cookie._get_cookies() == "cached response"
+    cookie._cookie_cache = None
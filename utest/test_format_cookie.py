@@ -37,3 +37,12 @@ def test_as_dot_dict(cookie: Cookie):
         assert dot_dict[0].expires is None
     else:
         assert dot_dict[0].expires == datetime.fromtimestamp(-1)
+
+
+def test_as_dot_dict_raw_expiry(cookie: Cookie):
+    epoch = 1604698517
+    dot_dict = cookie._format_cookies_as_dot_dict(
+        [{"name": "tidii", "value": 1111, "expires": epoch}],
+        expires_as_datetime=False,
+    )
+    assert dot_dict[0].expires == epoch